@@ -19,8 +19,10 @@ from typing import (
 import numpy as np
 import pandas as pd
 
+from pavise._schema_cache import schema_cache
 from pavise.exceptions import ValidationError
 from pavise.types import NotRequiredColumn
+from pavise.validators import Range
 
 # Special column name for index validation
 INDEX_COLUMN_NAME = "__index__"
@@ -103,6 +105,112 @@ TYPE_TO_DTYPE = {
 }
 
 
+@schema_cache
+def _get_schema_hints(schema: type) -> dict[str, Any]:
+    """
+    Resolve the type hints of a Protocol schema.
+
+    get_type_hints re-evaluates every annotation, so the result is cached per schema.
+    The returned dict is shared and must not be mutated.
+    """
+    return get_type_hints(schema, include_extras=True)
+
+
+# How a column's type is checked: "dtype" for a extension dtype class, "literal" for
+# Literal[...], "union" for a union of Python types and "type" for a single Python type
+ColumnKind = Literal["dtype", "literal", "union", "type"]
+
+
+def _column_kind(base_type: Any) -> ColumnKind:
+    """Classify how a column with the given base type is type-checked."""
+    if isinstance(base_type, type) and issubclass(base_type, pd.api.extensions.ExtensionDtype):
+        return "dtype"
+    if get_origin(base_type) is Literal:
+        return "literal"
+    if isinstance(base_type, tuple):
+        return "union"
+    return "type"
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Type information and validators of a schema column, resolved once per schema."""
+
+    name: str
+    kind: ColumnKind
+    annotation: Any
+    base_type: Any
+    validators: tuple
+    is_optional: bool
+    is_not_required: bool
+    checker: TypeChecker | None
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """
+    A Protocol schema resolved once into what validation needs.
+
+    Range validators of required columns are additionally packed into parallel tuples,
+    so they can all be checked with min/max reductions without per-validator dispatch.
+    """
+
+    columns: tuple[ColumnSpec, ...]
+    # Names of the schema's columns, excluding the index, for the strict-mode check
+    column_names: frozenset[str]
+    range_columns: tuple[str, ...]
+    range_mins: tuple[float, ...]
+    range_maxs: tuple[float, ...]
+
+
+@schema_cache
+def _compile_schema(schema: type) -> CompiledSchema:
+    """
+    Decompose a Protocol schema into a flat tuple of column specs.
+
+    Annotations are only unwrapped once per schema, so validation is a plain loop over
+    the returned specs. The index annotation, if any, is kept under INDEX_COLUMN_NAME.
+    """
+    specs = []
+    for col_name, col_type in _get_schema_hints(schema).items():
+        if col_name == INDEX_COLUMN_NAME:
+            base_type, _index_name, validators, is_optional = (
+                _extract_index_name_type_and_validators(col_type)
+            )
+            is_not_required = False
+        else:
+            base_type, validators, is_optional, is_not_required = _extract_type_and_validators(
+                col_type
+            )
+        specs.append(
+            ColumnSpec(
+                name=col_name,
+                kind=_column_kind(base_type),
+                annotation=col_type,
+                base_type=base_type,
+                validators=tuple(validators),
+                is_optional=is_optional,
+                is_not_required=is_not_required,
+                checker=TYPE_CHECKERS.get(base_type),
+            )
+        )
+
+    ranges = [
+        (spec.name, validator)
+        for spec in specs
+        if spec.name != INDEX_COLUMN_NAME and not spec.is_not_required
+        for validator in spec.validators
+        if isinstance(validator, Range)
+    ]
+    return CompiledSchema(
+        columns=tuple(specs),
+        column_names=frozenset(spec.name for spec in specs if spec.name != INDEX_COLUMN_NAME),
+        range_columns=tuple(col_name for col_name, _ in ranges),
+        range_mins=tuple(validator.min for _, validator in ranges),
+        range_maxs=tuple(validator.max for _, validator in ranges),
+    )
+
+
 def validate_dataframe(df: pd.DataFrame, schema: type, strict: bool = False) -> None:
     """
     Validate that a DataFrame conforms to a Protocol schema.
@@ -116,28 +224,52 @@ def validate_dataframe(df: pd.DataFrame, schema: type, strict: bool = False) ->
         ValueError: If a required column is missing or type is unsupported
         TypeError: If a column has the wrong type
     """
-    expected_cols = get_type_hints(schema, include_extras=True)
+    from pavise._pandas.validator_impl import apply_validator, within_ranges
+
+    compiled = _compile_schema(schema)
+    # Validators hold vacuously on zero rows, so an empty frame only needs its types checked
+    has_rows = len(df) > 0
+    # When the packed Range check passes, the Range validators of required columns are
+    # done; otherwise they run one by one to report the failing column with samples
+    ranges_passed = (
+        has_rows
+        and bool(compiled.range_columns)
+        and within_ranges(df, compiled.range_columns, compiled.range_mins, compiled.range_maxs)
+    )
 
-    for col_name, col_type in expected_cols.items():
-        if col_name == INDEX_COLUMN_NAME:
-            _check_index_type(df, col_type)
-        else:
-            is_not_required = isinstance(col_type, type) and issubclass(col_type, NotRequiredColumn)
-            if is_not_required and col_name not in df.columns:
+    # Each column is type-checked and then validated before the next one, so the error
+    # reported is always that of the first failing column in schema order
+    for spec in compiled.columns:
+        if spec.is_not_required and spec.name not in df.columns:
+            continue
+        validators = _check_spec(df, spec)
+        if not has_rows:
+            continue
+        for validator in validators:
+            if ranges_passed and isinstance(validator, Range) and not spec.is_not_required:
                 continue
-            _check_column_exists(df, col_name)
-            _check_column_type(df, col_name, col_type)
+            apply_validator(df[spec.name], validator, spec.name)
 
     if strict:
-        schema_cols = set(expected_cols.keys())
-        if INDEX_COLUMN_NAME in schema_cols:
-            schema_cols.remove(INDEX_COLUMN_NAME)
-        df_cols = set(df.columns)
-        extra_cols = df_cols - schema_cols
+        extra_cols = set(df.columns) - compiled.column_names
         if extra_cols:
             raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
 
 
+def _check_spec(df: pd.DataFrame, spec: ColumnSpec) -> tuple:
+    """
+    Run the type checks of one schema entry (the index or a column).
+
+    Returns:
+        Validators to apply to the column now that its type check has passed
+    """
+    if spec.name == INDEX_COLUMN_NAME:
+        _check_index_type(df, spec.annotation)
+        return ()
+    _check_column_exists(df, spec.name)
+    return _check_column_type(df, spec)
+
+
 def _extract_type_and_validators(
     annotation: type,
 ) -> tuple[type | tuple[type, ...], list, bool, bool]:
@@ -322,16 +454,36 @@ def _check_column_exists(df: pd.DataFrame, col_name: str) -> None:
         raise ValidationError("missing", column_name=col_name)
 
 
-def _check_column_type(df: pd.DataFrame, col_name: str, expected_type: type) -> None:
-    """Check if a column has the expected type and apply validators."""
-    from pavise._pandas.validator_impl import apply_validator
+def _has_nulls(series: pd.Series) -> bool:
+    """
+    Check if series contains missing values.
 
-    base_type, validators, is_optional, _is_not_required = _extract_type_and_validators(
-        expected_type
-    )
+    Works on the underlying array, so no intermediate boolean Series is built, and
+    skips the scan for NumPy integer and bool columns, which cannot hold missing values.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        if dtype.kind in "iub":
+            return False
+        return bool(pd.isna(series.to_numpy()).any())
+    return bool(series.array.isna().any())
 
-    if isinstance(base_type, type) and issubclass(base_type, pd.api.extensions.ExtensionDtype):
-        col_dtype = df[col_name].dtype
+
+def _check_column_type(df: pd.DataFrame, spec: ColumnSpec) -> tuple:
+    """
+    Check if a column has the expected type.
+
+    Returns:
+        Validators to apply to the column now that its type check has passed
+    """
+    col_name = spec.name
+    base_type = spec.base_type
+    validators = spec.validators
+    is_optional = spec.is_optional
+    series = df[col_name]
+
+    if spec.kind == "dtype":
+        col_dtype = series.dtype
         if type(col_dtype) is not base_type:
             base_tname = base_type.__name__
             col_tname = type(col_dtype).__name__
@@ -339,15 +491,13 @@ def _check_column_type(df: pd.DataFrame, col_name: str, expected_type: type) ->
                 f"expected {base_tname}, got {col_tname}",
                 column_name=col_name,
             )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        return validators
 
-    if get_origin(base_type) is Literal:
+    if spec.kind == "literal":
         allowed_values = get_args(base_type)
-        invalid_mask = ~df[col_name].isin(allowed_values)
+        invalid_mask = ~series.isin(allowed_values)
         if invalid_mask.any():
-            invalid_df = df[col_name][invalid_mask]
+            invalid_df = series[invalid_mask]
             samples = [(idx, invalid_df[idx]) for idx in invalid_df.index]
             samples = samples[:MAX_SAMPLE_SIZE]
             raise ValidationError.new_with_samples(
@@ -357,12 +507,10 @@ def _check_column_type(df: pd.DataFrame, col_name: str, expected_type: type) ->
                 len(invalid_df),
                 repr,
             )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        return validators
 
     # Handle Union types (represented as tuple)
-    if isinstance(base_type, tuple):
+    if spec.kind == "union":
         union_types = base_type
         # Check if all types in the union are supported
         for union_type in union_types:
@@ -375,44 +523,41 @@ def _check_column_type(df: pd.DataFrame, col_name: str, expected_type: type) ->
                 return is_optional
             return any(TYPE_CHECKERS[t].value(value) for t in union_types)
 
-        invalid_mask = ~df[col_name].apply(check_union_value)
+        invalid_mask = ~series.apply(check_union_value)
         if invalid_mask.any():
-            invalid_df = df[col_name][invalid_mask]
+            invalid_df = series[invalid_mask]
             samples = [(idx, invalid_df[idx]) for idx in invalid_df.index]
             samples = samples[:MAX_SAMPLE_SIZE]
             union_type_names = " | ".join(t.__name__ for t in union_types)
             raise ValidationError.new_with_samples(
                 col_name,
-                f"expected {union_type_names}, got {df[col_name].dtype}",
+                f"expected {union_type_names}, got {series.dtype}",
                 samples,
                 len(invalid_df),
                 repr,
             )
 
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        return validators
 
-    if base_type not in TYPE_CHECKERS:
+    checker = spec.checker
+    if checker is None:
         raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
 
-    checker = TYPE_CHECKERS[base_type]
-    col_dtype = df[col_name].dtype
+    col_dtype = series.dtype
 
-    if not is_optional and df[col_name].isna().any():
+    if not is_optional and _has_nulls(series):
         raise ValidationError("is non-optional but contains null values", column_name=col_name)
-    if not checker.dtype(df[col_name]):
-        invalid_mask = df[col_name].apply(checker.value)
-        invalid_df = df[col_name][~invalid_mask]
+    if not checker.dtype(series):
+        invalid_mask = series.apply(checker.value)
+        invalid_df = series[~invalid_mask]
         samples = [(idx, invalid_df[idx]) for idx in invalid_df.index]
         samples = samples[:MAX_SAMPLE_SIZE]
         raise ValidationError.new_with_samples(
             col_name,
             f"expected {base_type.__name__}, got {col_dtype}",
             samples,
-            len(df[col_name][~invalid_mask]),
+            len(invalid_df),
             repr,
         )
 
-    for validator in validators:
-        apply_validator(df[col_name], validator, col_name)
+    return validators
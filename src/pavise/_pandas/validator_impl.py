@@ -1,7 +1,9 @@
 """Pandas-specific validator implementations."""
 
+from collections.abc import Callable, Sequence
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from pavise.exceptions import ValidationError
@@ -10,6 +12,12 @@ from pavise.validators import Custom, In, MaxLen, MinLen, Range, Regex, Unique
 # Maximum number of invalid sample values to show in error messages
 MAX_SAMPLE_SIZE = 5
 
+# Integer columns whose value span is at most this many times their length are checked
+# for duplicates by counting values in a dense array instead of building a hash table
+DENSE_SPAN_FACTOR = 4
+# Number of leading values whose order is checked before testing a column for sortedness
+SORTED_PROBE_SIZE = 64
+
 
 def apply_validator(series: pd.Series, validator: Any, col_name: str) -> None:
     """
@@ -23,25 +31,63 @@ def apply_validator(series: pd.Series, validator: Any, col_name: str) -> None:
     Raises:
         ValueError: if validation fails
     """
-    if isinstance(validator, Range):
-        _validate_range(series, validator, col_name)
-    elif isinstance(validator, Unique):
-        _validate_unique(series, col_name)
-    elif isinstance(validator, In):
-        _validate_in(series, validator, col_name)
-    elif isinstance(validator, Regex):
-        _validate_regex(series, validator, col_name)
-    elif isinstance(validator, MinLen):
-        _validate_minlen(series, validator, col_name)
-    elif isinstance(validator, MaxLen):
-        _validate_maxlen(series, validator, col_name)
-    elif isinstance(validator, Custom):
-        _validate_custom(series, validator, col_name)
-    else:
+    handler = _lookup_by_type(_HANDLERS, type(validator))
+    if handler is None:
         raise ValidationError(f"Unknown validator type: {type(validator)}")
+    handler(series, validator, col_name)
+
+
+def within_ranges(
+    df: pd.DataFrame,
+    columns: tuple[str, ...],
+    mins: tuple[float, ...],
+    maxs: tuple[float, ...],
+) -> bool:
+    """
+    Check packed Range validators with one min/max reduction per column.
+
+    Args:
+        df: pandas DataFrame to validate
+        columns: column name of each Range validator
+        mins: lower bound of each Range validator
+        maxs: upper bound of each Range validator
+
+    Returns:
+        True if every column exists, is NumPy-backed numeric and is within its bounds.
+        False means the Range validators have to be applied one by one.
+    """
+    for col_name, lo, hi in zip(columns, mins, maxs):
+        if col_name not in df.columns:
+            return False
+        series = df[col_name]
+        if not _is_numpy_numeric(series):
+            return False
+        if not _values_within(series.to_numpy(), lo, hi):
+            return False
+    return True
+
+
+def _values_within(values: np.ndarray, lo: float, hi: float) -> bool:
+    """
+    Check with a min and a max reduction that no value is outside [lo, hi].
+
+    The reductions read the array without allocating a mask. NaN is skipped by
+    fmin/fmax, like the row mask, which never flags NaN; an all-NaN array is reported
+    as not within so that the caller falls back to the mask.
+    """
+    if len(values) == 0:
+        return True
+    return bool(np.fmin.reduce(values) >= lo and np.fmax.reduce(values) <= hi)
+
+
+def _is_numpy_numeric(series: pd.Series) -> bool:
+    """Check if series is backed by a plain numeric NumPy array."""
+    return isinstance(series.dtype, np.dtype) and series.dtype.kind in "iuf"
 
 
-def _get_invalid_samples(series: pd.Series, invalid_mask: pd.Series) -> tuple[list[tuple], int]:
+def _get_invalid_samples(
+    series: pd.Series, invalid_mask: pd.Series | np.ndarray
+) -> tuple[list[tuple], int]:
     """
     Extract invalid samples and total count from an invalid mask.
 
@@ -52,34 +98,80 @@ def _get_invalid_samples(series: pd.Series, invalid_mask: pd.Series) -> tuple[li
     Returns:
         Tuple of (samples, total_invalid) where samples is a list of (index, value) tuples
     """
-    invalid_indices = series.index[invalid_mask][:MAX_SAMPLE_SIZE]
-    samples = [(idx, series.loc[idx]) for idx in invalid_indices]
-    total_invalid = invalid_mask.sum()
-    return samples, total_invalid
+    invalid = series[invalid_mask]
+    samples = [(idx, invalid.iloc[pos]) for pos, idx in enumerate(invalid.index[:MAX_SAMPLE_SIZE])]
+    return samples, len(invalid)
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray | None:
+    """
+    Return the non-null values of a numeric series as a NumPy array.
+
+    NumPy-backed columns are returned without copying. Nullable extension arrays
+    (Int64, Float64, int64[pyarrow], ...) drop their missing values first.
+    Returns None for non-numeric dtypes.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype):
+        return series.to_numpy() if dtype.kind in "iuf" else None
+    numpy_dtype = getattr(dtype, "numpy_dtype", None)
+    if numpy_dtype is not None and numpy_dtype.kind in "iuf":
+        return series.dropna().to_numpy(dtype=numpy_dtype)
+    return None
+
+
+def _string_lengths(series: pd.Series, unit: str = "chars") -> pd.Series:
+    """
+    Compute the length of each string in series, in characters or UTF-8 bytes.
+
+    Arrow-backed string columns are measured with Arrow's utf8_length or binary_length
+    kernel, which work on the offsets and data buffers instead of looping over Python
+    strings.
+    """
+    arrow_array_type = getattr(pd.arrays, "ArrowExtensionArray", None)
+    if arrow_array_type is not None and isinstance(series.array, arrow_array_type):
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        pa_array = pa.array(series.array)
+        if pa.types.is_string(pa_array.type) or pa.types.is_large_string(pa_array.type):
+            length_kernel = pc.binary_length if unit == "bytes" else pc.utf8_length
+            lengths = length_kernel(pa_array).to_numpy(zero_copy_only=False)
+            return pd.Series(lengths, index=series.index)
+    if unit == "bytes":
+        return series.str.encode("utf-8").str.len()
+    return series.str.len()
 
 
 def _validate_range(series: pd.Series, validator: Range, col_name: str) -> None:
     """Validate that all values in series are within the specified range."""
-    invalid_mask = (series < validator.min) | (series > validator.max)
+    lo = validator.min
+    hi = validator.max
+    values = _numeric_values(series)
+    if values is not None and _values_within(values, lo, hi):
+        return
+
+    invalid_mask = (series < lo) | (series > hi)
     if not invalid_mask.any():
         return
 
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(
         col_name,
-        f"values must be in range [{validator.min}, {validator.max}]",
+        f"values must be in range [{lo}, {hi}]",
         samples,
         total_invalid,
         format_value=str,
     )
 
 
-def _validate_unique(series: pd.Series, col_name: str) -> None:
+def _validate_unique(series: pd.Series, validator: Unique, col_name: str) -> None:
     """Validate that all values in series are unique (no duplicates)."""
-    duplicated_mask = series.duplicated(keep=False)
-    if not duplicated_mask.any():
+    if not _has_duplicates(series):
         return
 
+    duplicated_mask = series.duplicated(keep=False)
+
     samples, total_invalid = _get_invalid_samples(series, duplicated_mask)
     raise ValidationError.new_with_samples(
         col_name,
@@ -90,9 +182,47 @@ def _validate_unique(series: pd.Series, col_name: str) -> None:
     )
 
 
+def _has_duplicates(series: pd.Series) -> bool:
+    """
+    Check if series contains duplicate values.
+
+    Integer columns with a small value span (ids, codes, counters) are counted with
+    np.bincount, which is several times faster than the hash table behind is_unique.
+    Sorted numeric and datetime columns (increasing ids, timestamps) only need each
+    value compared with its neighbour.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iufmM" and len(series) > 1:
+        values = series.to_numpy()
+        if dtype.kind in "iu":
+            lo = values.min()
+            if int(values.max()) - int(lo) < DENSE_SPAN_FACTOR * len(values):
+                return bool(np.bincount((values - lo).astype(np.intp)).max() > 1)
+        if _is_sorted(series, values):
+            # Equal values of a sorted column are adjacent
+            return bool(np.any(values[1:] == values[:-1]))
+    return not series.is_unique
+
+
+def _is_sorted(series: pd.Series, values: np.ndarray) -> bool:
+    """
+    Check if series is sorted in either direction.
+
+    A short prefix is checked first, which rejects most unsorted columns without a
+    full pass. Columns containing NaN or NaT are never reported as sorted.
+    """
+    head = values[:SORTED_PROBE_SIZE]
+    if not (np.all(head[1:] >= head[:-1]) or np.all(head[1:] <= head[:-1])):
+        return False
+    return series.is_monotonic_increasing or series.is_monotonic_decreasing
+
+
 def _validate_in(series: pd.Series, validator: In, col_name: str) -> None:
     """Validate that all values in series are within the allowed set."""
-    invalid_mask = ~series.isin(validator.allowed_values)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        invalid_mask = ~_categorical_isin(series, validator.allowed_values)
+    else:
+        invalid_mask = ~series.isin(validator.allowed_values)
     if not invalid_mask.any():
         return
 
@@ -102,9 +232,22 @@ def _validate_in(series: pd.Series, validator: In, col_name: str) -> None:
     )
 
 
+def _categorical_isin(series: pd.Series, allowed_values: Sequence[Any]) -> np.ndarray:
+    """
+    Check membership of a categorical series by its categories instead of its values.
+
+    Each category is looked up once and the per-row result is gathered with the
+    integer codes, so no row value is hashed.
+    """
+    allowed = series.cat.categories.isin(allowed_values)
+    # Missing values have code -1, which picks the trailing "is NaN allowed" entry
+    nan_allowed = bool(pd.Index(allowed_values).isna().any())
+    return np.append(allowed, nan_allowed)[series.cat.codes.to_numpy()]
+
+
 def _validate_regex(series: pd.Series, validator: Regex, col_name: str) -> None:
     """Validate that all values in series match the regex pattern."""
-    invalid_mask = ~series.str.match(validator.pattern)
+    invalid_mask = _regex_invalid_mask(series, validator)
     if not invalid_mask.any():
         return
 
@@ -114,11 +257,35 @@ def _validate_regex(series: pd.Series, validator: Regex, col_name: str) -> None:
     )
 
 
+def _regex_invalid_mask(series: pd.Series, validator: Regex) -> np.ndarray | pd.Series:
+    """Mark the values of series that don't match the pattern; missing values are valid."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # The pattern runs once per category and rows pick up their category's result;
+        # missing values have code -1, which picks the trailing False
+        invalid = _regex_invalid_mask(pd.Series(series.cat.categories), validator)
+        invalid = np.append(np.asarray(invalid, dtype=bool), False)
+        return invalid[series.cat.codes.to_numpy()]
+    if validator._compiled is not None and series.dtype == object:
+        match = validator._compiled.match
+        return np.fromiter(
+            (isinstance(value, str) and match(value) is None for value in series.to_numpy()),
+            dtype=bool,
+            count=len(series),
+        )
+    # Arrow-backed strings are matched by pyarrow's regex kernel inside pandas. The str
+    # dtype reports missing values as not matching, so they are masked out explicitly
+    matched = series.str.match(validator.pattern).astype("boolean").fillna(True)
+    return ~matched & series.notna()
+
+
 def _validate_minlen(series: pd.Series, validator: MinLen, col_name: str) -> None:
     """Validate that all string values have minimum length."""
-    invalid_mask = series.str.len() < validator.min_length
-    if not invalid_mask.any():
+    min_length = validator.min_length
+    lengths = _string_lengths(series, validator.unit)
+    shortest = lengths.min()
+    if pd.isna(shortest) or shortest >= min_length:
         return
+    invalid_mask = lengths < min_length
 
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(
@@ -126,15 +293,18 @@ def _validate_minlen(series: pd.Series, validator: MinLen, col_name: str) -> Non
         "contains strings shorter than minimum length",
         samples,
         total_invalid,
-        format_value=lambda val: f"{repr(val)} (length: {len(val)})",
+        format_value=_length_formatter(validator.unit),
     )
 
 
 def _validate_maxlen(series: pd.Series, validator: MaxLen, col_name: str) -> None:
     """Validate that all string values have maximum length."""
-    invalid_mask = series.str.len() > validator.max_length
-    if not invalid_mask.any():
+    max_length = validator.max_length
+    lengths = _string_lengths(series, validator.unit)
+    longest = lengths.max()
+    if pd.isna(longest) or longest <= max_length:
         return
+    invalid_mask = lengths > max_length
 
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(
@@ -142,10 +312,17 @@ def _validate_maxlen(series: pd.Series, validator: MaxLen, col_name: str) -> Non
         "contains strings longer than maximum length",
         samples,
         total_invalid,
-        format_value=lambda val: f"{repr(val)} (length: {len(val)})",
+        format_value=_length_formatter(validator.unit),
     )
 
 
+def _length_formatter(unit: str) -> Callable[[Any], str]:
+    """Format a sample string with its length in the validator's unit."""
+    if unit == "bytes":
+        return lambda val: f"{repr(val)} (length: {len(val.encode())} bytes)"
+    return lambda val: f"{repr(val)} (length: {len(val)})"
+
+
 def _validate_custom(series: pd.Series, validator: Custom, col_name: str) -> None:
     """Validate using a custom function."""
     invalid_mask = ~series.apply(validator.func)
@@ -154,3 +331,31 @@ def _validate_custom(series: pd.Series, validator: Custom, col_name: str) -> Non
 
     samples, total_invalid = _get_invalid_samples(series, invalid_mask)
     raise ValidationError.new_with_samples(col_name, validator.message, samples, total_invalid)
+
+
+# Validator type -> implementation, looked up through _lookup_by_type in apply_validator
+_HANDLERS: dict[type, Callable[[pd.Series, Any, str], None] | None] = {
+    Range: _validate_range,
+    Unique: _validate_unique,
+    In: _validate_in,
+    Regex: _validate_regex,
+    MinLen: _validate_minlen,
+    MaxLen: _validate_maxlen,
+    Custom: _validate_custom,
+}
+
+
+def _lookup_by_type(table: dict[type, Any], validator_type: type) -> Any:
+    """
+    Find the entry of a validator type in a dispatch table, honouring subclasses.
+
+    The first lookup of a type walks its MRO; the entry found, or None, is then stored
+    under the type itself, so later lookups are a single dict access.
+    """
+    try:
+        return table[validator_type]
+    except KeyError:
+        pass
+    entry = next((table[base] for base in validator_type.__mro__ if base in table), None)
+    table[validator_type] = entry
+    return entry
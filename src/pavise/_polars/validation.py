@@ -23,6 +23,7 @@ try:
 except ImportError:
     raise ImportError("Polars is not installed. Install it with: pip install pavise[polars]")
 
+from pavise._schema_cache import schema_cache
 from pavise.exceptions import ValidationError
 
 # Maximum number of invalid sample values to show in error messages
@@ -48,14 +49,19 @@ def _is_datetime_dtype(dtype):
     return False
 
 
+# Polars dtype instances hash like their classes, so membership is one hash lookup
+_INT_DTYPES = frozenset(
+    {pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64}
+)
+_FLOAT_DTYPES = frozenset({pl.Float32, pl.Float64})
+
 TYPE_CHECKERS = {
     int: TypeChecker(
-        dtype=lambda dtype: dtype
-        in (pl.Int8, pl.Int16, pl.Int32, pl.Int64, pl.UInt8, pl.UInt16, pl.UInt32, pl.UInt64),
+        dtype=_INT_DTYPES.__contains__,
         value=lambda x: isinstance(x, int) and not isinstance(x, bool),
     ),
     float: TypeChecker(
-        dtype=lambda dtype: dtype in (pl.Float32, pl.Float64),
+        dtype=_FLOAT_DTYPES.__contains__,
         value=lambda x: isinstance(x, (int, float)) and not isinstance(x, bool),
     ),
     str: TypeChecker(
@@ -97,6 +103,98 @@ TYPE_TO_DTYPE = {
 }
 
 
+@schema_cache
+def _get_schema_hints(schema: type) -> dict[str, Any]:
+    """
+    Resolve the type hints of a Protocol schema.
+
+    get_type_hints re-evaluates every annotation, so the result is cached per schema.
+    The returned dict is shared and must not be mutated.
+    """
+    return get_type_hints(schema, include_extras=True)
+
+
+# How a column's type is checked: "dtype" for a polars DataType class, "literal" for
+# Literal[...], "union" for a union of Python types and "type" for a single Python type
+ColumnKind = Literal["dtype", "literal", "union", "type"]
+
+
+def _column_kind(base_type: Any) -> ColumnKind:
+    """Classify how a column with the given base type is type-checked."""
+    if isinstance(base_type, type) and issubclass(base_type, pl.DataType):
+        return "dtype"
+    if get_origin(base_type) is Literal:
+        return "literal"
+    if isinstance(base_type, tuple):
+        return "union"
+    return "type"
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """Type information and validators of a schema column, resolved once per schema."""
+
+    name: str
+    kind: ColumnKind
+    base_type: Any
+    validators: tuple
+    is_optional: bool
+    is_not_required: bool
+    checker: TypeChecker | None
+
+
+@dataclass(frozen=True)
+class CompiledSchema:
+    """A Protocol schema resolved once into what validation needs."""
+
+    columns: tuple[ColumnSpec, ...]
+    # Names of the schema's columns, for the strict-mode check
+    column_names: frozenset[str]
+
+
+@schema_cache
+def _compile_schema(schema: type) -> CompiledSchema:
+    """
+    Decompose a Protocol schema into a flat tuple of column specs.
+
+    Annotations are only unwrapped once per schema, so validation is a plain loop over
+    the returned specs.
+    """
+    specs = []
+    for col_name, col_type in _get_schema_hints(schema).items():
+        base_type, validators, is_optional, is_not_required = _extract_type_and_validators(col_type)
+        specs.append(
+            ColumnSpec(
+                name=col_name,
+                kind=_column_kind(base_type),
+                base_type=base_type,
+                validators=tuple(validators),
+                is_optional=is_optional,
+                is_not_required=is_not_required,
+                checker=TYPE_CHECKERS.get(base_type),
+            )
+        )
+    return CompiledSchema(
+        columns=tuple(specs),
+        column_names=frozenset(spec.name for spec in specs),
+    )
+
+
+@schema_cache
+def _get_validator_exprs(schema: type, col_name: str) -> tuple:
+    """
+    Build the expressions of a column's validators, valid for any non-categorical dtype.
+
+    The expressions are built on the column's first value validation and then reused,
+    so polars expressions are not reconstructed on every validation. Schema-only checks
+    (LazyFrame construction, empty frames) never build them.
+    """
+    from pavise._polars.validator_impl import build_validator_exprs
+
+    spec = next(spec for spec in _compile_schema(schema).columns if spec.name == col_name)
+    return tuple(build_validator_exprs(validator, col_name) for validator in spec.validators)
+
+
 def validate_dataframe(df: pl.DataFrame, schema: type, strict: bool = False) -> None:
     """
     Validate that a Polars DataFrame conforms to a Protocol schema.
@@ -110,19 +208,43 @@ def validate_dataframe(df: pl.DataFrame, schema: type, strict: bool = False) ->
         ValueError: If a required column is missing or type is unsupported
         TypeError: If a column has the wrong type
     """
-    expected_cols = get_type_hints(schema, include_extras=True)
+    from pavise._polars.validator_impl import apply_validators, build_validator_exprs
 
-    for col_name, col_type in expected_cols.items():
-        is_not_required = isinstance(col_type, type) and issubclass(col_type, NotRequiredColumn)
-        if is_not_required and col_name not in df.columns:
+    compiled = _compile_schema(schema)
+    df_schema = df.schema
+    # Validators hold vacuously on zero rows, so an empty frame only needs its types checked
+    has_rows = df.height > 0
+    validator_exprs = []
+    type_error = None
+
+    for spec in compiled.columns:
+        if spec.is_not_required and spec.name not in df_schema:
+            continue
+        try:
+            _check_column_exists(df_schema, spec.name)
+            col_dtype = df_schema[spec.name]
+            validators = _check_column_type(df, spec, col_dtype)
+        except ValidationError as error:
+            # The validators of the columns before this one still run first, so the error
+            # reported is that of the first failing column in schema order
+            type_error = error
+            break
+        if not validators or not has_rows:
             continue
-        _check_column_exists(df, col_name)
-        _check_column_type(df, col_name, col_type)
+        if isinstance(col_dtype, (pl.Categorical, pl.Enum)):
+            # Some checks run on the distinct values, so their expressions depend on the dtype
+            validator_exprs.extend(
+                build_validator_exprs(validator, spec.name, col_dtype) for validator in validators
+            )
+        else:
+            validator_exprs.extend(_get_validator_exprs(schema, spec.name))
+
+    apply_validators(df, validator_exprs)
+    if type_error is not None:
+        raise type_error
 
     if strict:
-        schema_cols = set(expected_cols.keys())
-        df_cols = set(df.columns)
-        extra_cols = df_cols - schema_cols
+        extra_cols = set(df_schema.names()) - compiled.column_names
         if extra_cols:
             raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
 
@@ -140,19 +262,16 @@ def validate_lazyframe_schema(lf: pl.LazyFrame, schema: type, strict: bool = Fal
         strict: If True, raise error on extra columns not in schema
     """
     lf_schema = lf.collect_schema()
-    expected_cols = get_type_hints(schema, include_extras=True)
+    compiled = _compile_schema(schema)
 
-    for col_name, col_type in expected_cols.items():
-        is_not_required = isinstance(col_type, type) and issubclass(col_type, NotRequiredColumn)
-        if is_not_required and col_name not in lf_schema.names():
+    for spec in compiled.columns:
+        if spec.is_not_required and spec.name not in lf_schema.names():
             continue
-        _check_lazyframe_column_exists(lf_schema, col_name)
-        _check_lazyframe_column_type(lf_schema, col_name, col_type)
+        _check_lazyframe_column_exists(lf_schema, spec.name)
+        _check_lazyframe_column_type(lf_schema, spec)
 
     if strict:
-        schema_cols = set(expected_cols.keys())
-        lf_cols = set(lf_schema.names())
-        extra_cols = lf_cols - schema_cols
+        extra_cols = set(lf_schema.names()) - compiled.column_names
         if extra_cols:
             raise ValidationError(f"Strict mode: unexpected columns {sorted(extra_cols)}")
 
@@ -163,15 +282,14 @@ def _check_lazyframe_column_exists(lf_schema: pl.Schema, col_name: str) -> None:
         raise ValidationError("missing", column_name=col_name)
 
 
-def _check_lazyframe_column_type(lf_schema: pl.Schema, col_name: str, expected_type: type) -> None:
+def _check_lazyframe_column_type(lf_schema: pl.Schema, spec: ColumnSpec) -> None:
     """Check if a column has the expected type (schema-level only, no value validation)."""
-    base_type, _validators, _is_optional, _is_not_required = _extract_type_and_validators(
-        expected_type
-    )
+    col_name = spec.name
+    base_type = spec.base_type
 
     col_dtype = lf_schema[col_name]
 
-    if isinstance(base_type, type) and issubclass(base_type, pl.DataType):
+    if spec.kind == "dtype":
         if col_dtype != base_type:
             raise ValidationError(
                 f"expected {base_type.__name__}, got {col_dtype}",
@@ -179,7 +297,7 @@ def _check_lazyframe_column_type(lf_schema: pl.Schema, col_name: str, expected_t
             )
         return
 
-    if get_origin(base_type) is Literal:
+    if spec.kind == "literal":
         # Check base type of Literal (e.g., str for Literal["a", "b"], int for Literal[1, 2])
         literal_args = get_args(base_type)
         if literal_args:
@@ -195,16 +313,16 @@ def _check_lazyframe_column_type(lf_schema: pl.Schema, col_name: str, expected_t
 
     # Handle Union types (represented as tuple) - for LazyFrame,
     # we can only check dtype compatibility
-    if isinstance(base_type, tuple):
+    if spec.kind == "union":
         # For Union types in LazyFrame, we can't validate mixed values at schema level
         # Just check if the dtype is object (which can hold multiple types)
         # Full validation happens on collect()
         return
 
-    if base_type not in TYPE_CHECKERS:
+    checker = spec.checker
+    if checker is None:
         raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
 
-    checker = TYPE_CHECKERS[base_type]
     if not checker.dtype(col_dtype):
         raise ValidationError(
             f"expected {base_type.__name__}, got {col_dtype}",
@@ -267,16 +385,26 @@ def _extract_type_and_validators(
     return annotation, validators, is_optional, is_not_required
 
 
+def _get_invalid_samples(series: pl.Series, invalid_mask: pl.Series) -> list[tuple]:
+    """
+    Return (row index, value) pairs of the first invalid values in series.
+
+    The indices are read straight off the mask with arg_true and the values gathered
+    by index, without building and filtering an indexed DataFrame.
+    """
+    indices = invalid_mask.arg_true().head(MAX_SAMPLE_SIZE)
+    return list(zip(indices.to_list(), series.gather(indices).to_list()))
+
+
 def _raise_type_error_with_samples(
     df: pl.DataFrame, col_name: str, checker: TypeChecker, expected_type: type, actual_dtype
 ) -> None:
     """Raise TypeError with sample invalid values."""
-    invalid_mask = df[col_name].map_elements(lambda v: not checker.value(v))
-    invalid_df = df[col_name].to_frame().with_row_index("__row__").filter(invalid_mask)
-    samples = [
-        (row["__row__"], row[col_name])
-        for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
-    ]
+    # return_dtype lets polars type the mask of an empty or all-null column
+    invalid_mask = df[col_name].map_elements(
+        lambda v: not checker.value(v), return_dtype=pl.Boolean
+    )
+    samples = _get_invalid_samples(df[col_name], invalid_mask)
     total_invalid = int(invalid_mask.sum())
 
     raise ValidationError.new_with_samples(
@@ -287,40 +415,40 @@ def _raise_type_error_with_samples(
     )
 
 
-def _check_column_exists(df: pl.DataFrame, col_name: str) -> None:
-    """Check if a column exists in the DataFrame."""
-    if col_name not in df.columns:
+def _check_column_exists(df_schema: pl.Schema, col_name: str) -> None:
+    """Check if a column exists in the DataFrame schema."""
+    if col_name not in df_schema:
         raise ValidationError("missing", column_name=col_name)
 
 
-def _check_column_type(df: pl.DataFrame, col_name: str, expected_type: type) -> None:
-    """Check if a column has the expected type and apply validators."""
-    from pavise._polars.validator_impl import apply_validator
+def _check_column_type(df: pl.DataFrame, spec: ColumnSpec, col_dtype: pl.DataType) -> tuple:
+    """
+    Check if a column has the expected type.
 
-    base_type, validators, is_optional, _is_not_required = _extract_type_and_validators(
-        expected_type
-    )
+    The dtype is taken from the DataFrame schema; the column itself is only fetched
+    when its values need to be inspected.
 
-    if isinstance(base_type, type) and issubclass(base_type, pl.DataType):
-        col_dtype = df[col_name].dtype
+    Returns:
+        Validators to apply to the column once all type checks have passed
+    """
+    col_name = spec.name
+    base_type = spec.base_type
+    validators = spec.validators
+    is_optional = spec.is_optional
+
+    if spec.kind == "dtype":
         if col_dtype != base_type:
             raise ValidationError(
                 f"expected {base_type.__name__}, got {col_dtype}",
                 column_name=col_name,
             )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        return validators
 
-    if get_origin(base_type) is Literal:
+    if spec.kind == "literal":
         allowed_values = get_args(base_type)
         invalid_mask = ~df[col_name].is_in(allowed_values)
         if invalid_mask.any():
-            invalid_df = df[col_name].to_frame().with_row_index("__row__").filter(invalid_mask)
-            samples = [
-                (row["__row__"], row[col_name])
-                for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
-            ]
+            samples = _get_invalid_samples(df[col_name], invalid_mask)
             total_invalid = int(invalid_mask.sum())
             raise ValidationError.new_with_samples(
                 col_name,
@@ -329,12 +457,10 @@ def _check_column_type(df: pl.DataFrame, col_name: str, expected_type: type) ->
                 total_invalid,
                 repr,
             )
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        return validators
 
     # Handle Union types (represented as tuple)
-    if isinstance(base_type, tuple):
+    if spec.kind == "union":
         union_types = base_type
         # Check if all types in the union are supported
         for union_type in union_types:
@@ -351,35 +477,27 @@ def _check_column_type(df: pl.DataFrame, col_name: str, expected_type: type) ->
             lambda v: not check_union_value(v), return_dtype=pl.Boolean, skip_nulls=False
         )
         if invalid_mask.any():
-            invalid_df = df[col_name].to_frame().with_row_index("__row__").filter(invalid_mask)
-            samples = [
-                (row["__row__"], row[col_name])
-                for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
-            ]
+            samples = _get_invalid_samples(df[col_name], invalid_mask)
             total_invalid = int(invalid_mask.sum())
             union_type_names = " | ".join(t.__name__ for t in base_type)
             raise ValidationError.new_with_samples(
                 col_name,
-                f"expected {union_type_names}, got {df[col_name].dtype}",
+                f"expected {union_type_names}, got {col_dtype}",
                 samples,
                 total_invalid,
                 repr,
             )
 
-        for validator in validators:
-            apply_validator(df[col_name], validator, col_name)
-        return
+        return validators
 
-    if base_type not in TYPE_CHECKERS:
+    checker = spec.checker
+    if checker is None:
         raise ValidationError(f"unsupported type: {base_type}", column_name=col_name)
 
-    checker = TYPE_CHECKERS[base_type]
-    col_dtype = df[col_name].dtype
     if not checker.dtype(col_dtype):
         _raise_type_error_with_samples(df, col_name, checker, base_type, col_dtype)
 
     if not is_optional and df[col_name].null_count() > 0:
         raise ValidationError("is non-optional but contains null values", column_name=col_name)
 
-    for validator in validators:
-        apply_validator(df[col_name], validator, col_name)
+    return validators
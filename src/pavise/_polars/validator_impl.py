@@ -1,5 +1,7 @@
 """Polars-specific validator implementations."""
 
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
 from typing import Any
 
 try:
@@ -14,149 +16,284 @@ from pavise.validators import Custom, In, MaxLen, MinLen, Range, Regex, Unique
 MAX_SAMPLE_SIZE = 5
 
 
-def apply_validator(series: "pl.Series", validator: Any, col_name: str) -> None:
+def validator_to_expr(
+    validator: Any, col_name: str, dtype: "pl.DataType | None" = None
+) -> "pl.Expr":
     """
-    Apply a validator to a polars Series.
+    Build a boolean expression that marks the rows violating a validator.
 
     Args:
-        series: polars Series to validate
         validator: Validator instance (e.g., Range, Unique, In, Regex, MinLen, MaxLen)
-        col_name: column name for error messages
+        col_name: column name the validator applies to
+        dtype: dtype of the column, if known. Regex on Categorical and Enum columns is
+            then evaluated on the distinct values instead of on every row
+
+    Returns:
+        polars expression that evaluates to True for invalid rows
 
     Raises:
-        ValueError: if validation fails
+        ValidationError: if the validator type is unknown
     """
-    if isinstance(validator, Range):
-        _validate_range(series, validator, col_name)
-    elif isinstance(validator, Unique):
-        _validate_unique(series, col_name)
-    elif isinstance(validator, In):
-        _validate_in(series, validator, col_name)
-    elif isinstance(validator, Regex):
-        _validate_regex(series, validator, col_name)
-    elif isinstance(validator, MinLen):
-        _validate_minlen(series, validator, col_name)
-    elif isinstance(validator, MaxLen):
-        _validate_maxlen(series, validator, col_name)
-    elif isinstance(validator, Custom):
-        _validate_custom(series, validator, col_name)
-    else:
+    builder = _lookup_by_type(_EXPR_BUILDERS, type(validator))
+    if builder is None:
         raise ValidationError(f"Unknown validator type: {type(validator)}")
+    if isinstance(dtype, (pl.Categorical, pl.Enum)) and isinstance(validator, Regex):
+        builder = _categorical_regex_expr
+    return builder(pl.col(col_name), validator)
+
+
+def _range_expr(col: "pl.Expr", validator: Range) -> "pl.Expr":
+    # One fused comparison kernel instead of two comparisons and an OR. The bounds are
+    # wrapped in lit because is_between reads plain strings as column names
+    return ~col.is_between(pl.lit(validator.min), pl.lit(validator.max), closed="both")
+
+
+def _unique_expr(col: "pl.Expr", validator: Unique) -> "pl.Expr":
+    return col.is_duplicated()
+
+
+def _in_expr(col: "pl.Expr", validator: In) -> "pl.Expr":
+    return ~col.is_in(validator.allowed_values)
+
+
+def _regex_expr(col: "pl.Expr", validator: Regex) -> "pl.Expr":
+    return ~col.str.contains(validator._anchored)
+
+
+def _str_len(col: "pl.Expr", unit: str) -> "pl.Expr":
+    # len_bytes is a difference of string offsets; len_chars has to decode UTF-8
+    return col.str.len_bytes() if unit == "bytes" else col.str.len_chars()
+
 
+def _categorical_regex_expr(col: "pl.Expr", validator: Regex) -> "pl.Expr":
+    # The pattern runs once per distinct value; rows are then matched against the values
+    # that passed. get_categories is not used, since polars may return the process-wide
+    # category pool rather than the categories present in the column
+    values = col.unique()
+    matching = values.filter(values.cast(pl.String).str.contains(validator._anchored))
+    return ~col.is_in(matching.implode())
 
-def _get_invalid_samples(series: "pl.Series", invalid_mask: "pl.Series") -> tuple[list[tuple], int]:
+
+def _minlen_expr(col: "pl.Expr", validator: MinLen) -> "pl.Expr":
+    return _str_len(col, validator.unit) < validator.min_length
+
+
+def _maxlen_expr(col: "pl.Expr", validator: MaxLen) -> "pl.Expr":
+    return _str_len(col, validator.unit) > validator.max_length
+
+
+def _custom_expr(col: "pl.Expr", validator: Custom) -> "pl.Expr":
+    return ~col.map_elements(validator.func, return_dtype=pl.Boolean)
+
+
+# Validator type -> invalid-row expression builder, looked up through _lookup_by_type
+_EXPR_BUILDERS: dict[type, Callable[["pl.Expr", Any], "pl.Expr"] | None] = {
+    Range: _range_expr,
+    Unique: _unique_expr,
+    In: _in_expr,
+    Regex: _regex_expr,
+    MinLen: _minlen_expr,
+    MaxLen: _maxlen_expr,
+    Custom: _custom_expr,
+}
+
+
+@dataclass(frozen=True)
+class ValidatorExprs:
+    """A validator on one column together with its expressions, built once per schema."""
+
+    col_name: str
+    validator: Any
+    # True for the rows violating the validator
+    invalid: "pl.Expr"
+    # Scalar that is True when any row violates the validator
+    any_invalid: "pl.Expr"
+
+
+def build_validator_exprs(
+    validator: Any, col_name: str, dtype: "pl.DataType | None" = None
+) -> ValidatorExprs:
     """
-    Extract invalid samples and total count from an invalid mask.
+    Build the expressions checking a validator on a column.
 
     Args:
-        series: polars Series being validated
-        invalid_mask: Boolean mask indicating invalid values
+        validator: Validator instance (e.g., Range, Unique, In, Regex, MinLen, MaxLen)
+        col_name: column name the validator applies to
+        dtype: dtype of the column, if known (see validator_to_expr)
 
-    Returns:
-        Tuple of (samples, total_invalid) where samples is a list of (index, value) tuples
+    Raises:
+        ValidationError: if the validator type is unknown
     """
-    invalid_df = series.to_frame().with_row_index("__row__").filter(invalid_mask)
-    samples = [
-        (row["__row__"], row[series.name])
-        for row in invalid_df.head(MAX_SAMPLE_SIZE).iter_rows(named=True)
-    ]
-    total_invalid = int(invalid_mask.sum())
-    return samples, total_invalid
-
-
-def _validate_range(series: "pl.Series", validator: Range, col_name: str) -> None:
-    """Validate that all values in series are within the specified range."""
-    invalid_mask = (series < validator.min) | (series > validator.max)
-    if not invalid_mask.any():
-        return
-
-    samples, total_invalid = _get_invalid_samples(series, invalid_mask)
-    raise ValidationError.new_with_samples(
-        col_name,
-        f"values must be in range [{validator.min}, {validator.max}]",
-        samples,
-        total_invalid,
-        format_value=str,
+    invalid = validator_to_expr(validator, col_name, dtype)
+    return ValidatorExprs(
+        col_name=col_name,
+        validator=validator,
+        invalid=invalid,
+        any_invalid=_any_invalid_expr(validator, col_name, invalid),
     )
 
 
-def _validate_unique(series: "pl.Series", col_name: str) -> None:
-    """Validate that all values in series are unique (no duplicates)."""
-    duplicated_mask = series.is_duplicated()
-    if not duplicated_mask.any():
-        return
+def apply_validators(df: pl.DataFrame, validator_exprs: Sequence[ValidatorExprs]) -> None:
+    """
+    Apply validators to a polars DataFrame.
 
-    samples, total_invalid = _get_invalid_samples(series, duplicated_mask)
-    raise ValidationError.new_with_samples(
-        col_name,
-        "contains duplicate values",
-        samples,
-        total_invalid=total_invalid,
-        format_value=repr,
-    )
+    All validators are evaluated in a single lazy query over df so that polars can fuse
+    and parallelise the column scans. The query only reduces each validator to a
+    single boolean; invalid counts and samples are materialised for a failing
+    validator only.
 
+    Args:
+        df: polars DataFrame to validate
+        validator_exprs: validators to apply, with their prebuilt expressions
 
-def _validate_in(series: "pl.Series", validator: In, col_name: str) -> None:
-    """Validate that all values in series are within the allowed set."""
-    invalid_mask = ~series.is_in(validator.allowed_values)
-    if not invalid_mask.any():
+    Raises:
+        ValidationError: if validation fails
+    """
+    if not validator_exprs:
         return
 
-    samples, total_invalid = _get_invalid_samples(series, invalid_mask)
-    raise ValidationError.new_with_samples(
-        col_name, "contains values not in allowed values", samples, total_invalid
+    lf = df.lazy()
+    any_invalid = lf.select(
+        exprs.any_invalid.alias(f"__{i}__any") for i, exprs in enumerate(validator_exprs)
     )
+    result = any_invalid.collect().row(0)
 
+    for exprs, has_invalid in zip(validator_exprs, result):
+        if not has_invalid:
+            continue
+        samples, total_invalid = _get_invalid_samples(lf, exprs.col_name, exprs.invalid)
+        _raise_validation_error(exprs.validator, exprs.col_name, samples, total_invalid)
 
-def _validate_regex(series: "pl.Series", validator: Regex, col_name: str) -> None:
-    """Validate that all values in series match the regex pattern."""
-    invalid_mask = ~series.str.contains(f"^{validator.pattern}$")
-    if not invalid_mask.any():
-        return
 
-    samples, total_invalid = _get_invalid_samples(series, invalid_mask)
-    raise ValidationError.new_with_samples(
-        col_name, "contains values that don't match the pattern", samples, total_invalid
-    )
+def _any_invalid_expr(validator: Any, col_name: str, invalid_expr: "pl.Expr") -> "pl.Expr":
+    """
+    Build a scalar expression that is True when any row violates a validator.
 
+    Range, MinLen and MaxLen are reduced with min/max and Unique with n_unique so
+    that the success path allocates no mask. Other validators reduce their row mask.
+    """
+    builder = _lookup_by_type(_ANY_INVALID_BUILDERS, type(validator))
+    if builder is None:
+        return invalid_expr.any()
+    return builder(pl.col(col_name), validator)
 
-def _validate_minlen(series: "pl.Series", validator: MinLen, col_name: str) -> None:
-    """Validate that all string values have minimum length."""
-    invalid_mask = series.str.len_chars() < validator.min_length
-    if not invalid_mask.any():
-        return
 
-    samples, total_invalid = _get_invalid_samples(series, invalid_mask)
-    raise ValidationError.new_with_samples(
-        col_name,
-        "contains strings shorter than minimum length",
-        samples,
-        total_invalid,
-        format_value=lambda val: f"{repr(val)} (length: {len(val)})",
-    )
+def _range_any_invalid(col: "pl.Expr", validator: Range) -> "pl.Expr":
+    # nan_max keeps NaN, which compares greater than any number like the row mask does
+    return (col.min() < validator.min) | (col.nan_max() > validator.max)
 
 
-def _validate_maxlen(series: "pl.Series", validator: MaxLen, col_name: str) -> None:
-    """Validate that all string values have maximum length."""
-    invalid_mask = series.str.len_chars() > validator.max_length
-    if not invalid_mask.any():
-        return
+def _unique_any_invalid(col: "pl.Expr", validator: Unique) -> "pl.Expr":
+    return col.n_unique() < col.len()
 
-    samples, total_invalid = _get_invalid_samples(series, invalid_mask)
-    raise ValidationError.new_with_samples(
-        col_name,
-        "contains strings longer than maximum length",
-        samples,
-        total_invalid,
-        format_value=lambda val: f"{repr(val)} (length: {len(val)})",
-    )
 
+def _minlen_any_invalid(col: "pl.Expr", validator: MinLen) -> "pl.Expr":
+    return _str_len(col, validator.unit).min() < validator.min_length
 
-def _validate_custom(series: "pl.Series", validator: Custom, col_name: str) -> None:
-    """Validate using a custom function."""
-    invalid_mask = ~series.map_elements(validator.func)
-    if not invalid_mask.any():
-        return
 
-    samples, total_invalid = _get_invalid_samples(series, invalid_mask)
-    raise ValidationError.new_with_samples(col_name, validator.message, samples, total_invalid)
+def _maxlen_any_invalid(col: "pl.Expr", validator: MaxLen) -> "pl.Expr":
+    return _str_len(col, validator.unit).max() > validator.max_length
+
+
+# Validator type -> reduction proving the validator holds without a row mask, looked up
+# through _lookup_by_type
+_ANY_INVALID_BUILDERS: dict[type, Callable[["pl.Expr", Any], "pl.Expr"] | None] = {
+    Range: _range_any_invalid,
+    Unique: _unique_any_invalid,
+    MinLen: _minlen_any_invalid,
+    MaxLen: _maxlen_any_invalid,
+}
+
+
+def _get_invalid_samples(
+    lf: "pl.LazyFrame", col_name: str, invalid_expr: "pl.Expr"
+) -> tuple[list[tuple], int]:
+    """
+    Extract invalid samples and total count for a failing validator.
+
+    Args:
+        lf: polars LazyFrame being validated
+        col_name: column name the validator applies to
+        invalid_expr: Boolean expression indicating invalid values
+
+    Returns:
+        Tuple of (samples, total_invalid) where samples is a list of (index, value) tuples
+    """
+    result = lf.select(
+        invalid_expr.arg_true().head(MAX_SAMPLE_SIZE).alias("__row__"),
+        pl.col(col_name).filter(invalid_expr).head(MAX_SAMPLE_SIZE).alias("__value__"),
+        invalid_expr.sum().alias("__total__"),
+    ).collect()
+    samples = list(zip(result["__row__"].to_list(), result["__value__"].to_list()))
+    return samples, int(result["__total__"][0])
+
+
+def _raise_validation_error(
+    validator: Any, col_name: str, samples: list[tuple], total_invalid: int
+) -> None:
+    """Raise a ValidationError describing the failing validator."""
+    if isinstance(validator, Range):
+        raise ValidationError.new_with_samples(
+            col_name,
+            f"values must be in range [{validator.min}, {validator.max}]",
+            samples,
+            total_invalid,
+            format_value=str,
+        )
+    elif isinstance(validator, Unique):
+        raise ValidationError.new_with_samples(
+            col_name,
+            "contains duplicate values",
+            samples,
+            total_invalid=total_invalid,
+            format_value=repr,
+        )
+    elif isinstance(validator, In):
+        raise ValidationError.new_with_samples(
+            col_name, "contains values not in allowed values", samples, total_invalid
+        )
+    elif isinstance(validator, Regex):
+        raise ValidationError.new_with_samples(
+            col_name, "contains values that don't match the pattern", samples, total_invalid
+        )
+    elif isinstance(validator, MinLen):
+        raise ValidationError.new_with_samples(
+            col_name,
+            "contains strings shorter than minimum length",
+            samples,
+            total_invalid,
+            format_value=_length_formatter(validator.unit),
+        )
+    elif isinstance(validator, MaxLen):
+        raise ValidationError.new_with_samples(
+            col_name,
+            "contains strings longer than maximum length",
+            samples,
+            total_invalid,
+            format_value=_length_formatter(validator.unit),
+        )
+    elif isinstance(validator, Custom):
+        raise ValidationError.new_with_samples(col_name, validator.message, samples, total_invalid)
+
+
+def _length_formatter(unit: str) -> Callable[[Any], str]:
+    """Format a sample string with its length in the validator's unit."""
+    if unit == "bytes":
+        return lambda val: f"{repr(val)} (length: {len(val.encode())} bytes)"
+    return lambda val: f"{repr(val)} (length: {len(val)})"
+
+
+def _lookup_by_type(table: dict[type, Any], validator_type: type) -> Any:
+    """
+    Find the entry of a validator type in a dispatch table, honouring subclasses.
+
+    The first lookup of a type walks its MRO; the entry found, or None, is then stored
+    under the type itself, so later lookups are a single dict access.
+    """
+    try:
+        return table[validator_type]
+    except KeyError:
+        pass
+    entry = next((table[base] for base in validator_type.__mro__ if base in table), None)
+    table[validator_type] = entry
+    return entry
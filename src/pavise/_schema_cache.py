@@ -0,0 +1,33 @@
+"""Caching of values derived from Protocol schemas."""
+
+import functools
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def schema_cache(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Cache the results of func(schema, *args) per schema without keeping the schema alive.
+
+    Entries are held in a WeakKeyDictionary keyed on the schema, so a schema defined
+    inside a function or a test is released together with its cached values. The
+    cached values must therefore not reference the schema itself.
+    """
+    cache: weakref.WeakKeyDictionary[type, dict[tuple, Any]] = weakref.WeakKeyDictionary()
+
+    @functools.wraps(func)
+    def cached(schema: type, *args: Any) -> T:
+        results = cache.get(schema)
+        if results is None:
+            results = cache[schema] = {}
+        try:
+            return results[args]
+        except KeyError:
+            pass
+        result = results[args] = func(schema, *args)
+        return result
+
+    return cached
@@ -48,6 +48,7 @@ class ValidationError(PatrolError):
     ) -> Self:
         """
         Create a ValidationError with a formatted message including sample invalid values.
+
         Args:
             col_name: Column name
             base_message: Base error message (e.g., "values must be in range [0, 150]")
@@ -56,9 +57,10 @@ class ValidationError(PatrolError):
             format_value: Optional function to format values (default: repr)
 
         Returns:
-        Formatted error message
+            ValidationError whose message lists the formatted samples
         """
-        msg = base_message
-        msg += f"\n\nSample invalid values (showing first {len(samples)} of {total_invalid}):"
-        msg += "".join([f"\n  Row {idx}: {format_value(val)}" for idx, val in samples])
-        return cls(msg, column_name=col_name, invalid_samples=samples)
+        header = f"Sample invalid values (showing first {len(samples)} of {total_invalid}):"
+        rows = "".join(f"\n  Row {idx}: {format_value(val)}" for idx, val in samples)
+        return cls(
+            f"{base_message}\n\n{header}{rows}", column_name=col_name, invalid_samples=samples
+        )
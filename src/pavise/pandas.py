@@ -1,5 +1,6 @@
 """Pandas backend for type-parameterized DataFrame with Protocol-based schema validation."""
 
+import weakref
 from typing import (
     Any,
     Generic,
@@ -7,18 +8,67 @@ from typing import (
     TypeVar,
     get_args,
     get_origin,
-    get_type_hints,
 )
 
 import pandas as pd
 
 from pavise._pandas.validation import INDEX_COLUMN_NAME, validate_dataframe
+from pavise._schema_cache import schema_cache
 from pavise.types import NotRequiredColumn
 
 __all__ = ["DataFrame", "NotRequiredColumn"]
 
 SchemaT_co = TypeVar("SchemaT_co", covariant=True)
 
+# DataFrame[Schema] classes by schema, kept only while the class itself is referenced
+_typed_dataframes: weakref.WeakValueDictionary[type, type] = weakref.WeakValueDictionary()
+
+
+@schema_cache
+def _empty_frame_plan(
+    schema: type,
+) -> tuple[dict[str, Any], str | tuple[str, ...] | None, Any]:
+    """
+    Resolve the column dtypes and index of an empty DataFrame for a schema.
+
+    The result is cached per schema, so make_empty only allocates the empty columns.
+    The returned dict is shared and must not be mutated.
+
+    Returns:
+        Tuple of (column name -> dtype, index name, index base type)
+    """
+    from pavise._pandas.validation import (
+        _compile_schema,
+        _extract_index_name_type_and_validators,
+    )
+
+    column_dtypes = {}
+    index_name = None
+    index_base_type = None
+
+    for spec in _compile_schema(schema).columns:
+        if spec.name == INDEX_COLUMN_NAME:
+            index_base_type, index_name, _validators, _is_optional = (
+                _extract_index_name_type_and_validators(spec.annotation)
+            )
+            continue
+
+        base_type = spec.base_type
+
+        # Handle Union types (represented as tuple) - use first type
+        if isinstance(base_type, tuple):
+            base_type = base_type[0]
+
+        if get_origin(base_type) is Literal:
+            literal_values = get_args(base_type)
+            if literal_values:
+                first_value = literal_values[0]
+                base_type = type(first_value)
+
+        column_dtypes[spec.name] = _get_dtype_for_type(base_type)
+
+    return column_dtypes, index_name, index_base_type
+
 
 def _get_dtype_for_type(base_type: type) -> str | pd.api.extensions.ExtensionDtype:
     """
@@ -59,12 +109,20 @@ class DataFrame(pd.DataFrame, Generic[SchemaT_co]):
     _schema: type | None = None
 
     def __class_getitem__(cls, schema: type):
-        """Create a new DataFrame class with schema validation."""
+        """
+        Create a new DataFrame class with schema validation.
+
+        While a DataFrame[Schema] class is in use, subscribing again returns the same class.
+        The classes are held weakly, so they and their schemas can still be freed.
+        """
+        typed = _typed_dataframes.get(schema)
+        if typed is None:
 
-        class TypedDataFrame(DataFrame):
-            _schema = schema
+            class TypedDataFrame(DataFrame):
+                _schema = schema
 
-        return TypedDataFrame
+            typed = _typed_dataframes[schema] = TypedDataFrame
+        return typed
 
     def __new__(cls, data: Any = None, *args: Any, strict: bool = False, **kwargs: Any):
         """Create a new DataFrame instance."""
@@ -99,40 +157,10 @@ class DataFrame(pd.DataFrame, Generic[SchemaT_co]):
         if cls._schema is None:
             return cls({})
 
-        from pavise._pandas.validation import (
-            _extract_index_name_type_and_validators,
-            _extract_type_and_validators,
-        )
-
-        type_hints = get_type_hints(cls._schema, include_extras=True)
-        columns = {}
-        index_name = None
-        index_base_type = None
-
-        for col_name, col_type in type_hints.items():
-            if col_name == INDEX_COLUMN_NAME:
-                # Extract index name from schema
-                index_base_type, index_name, _validators, _is_optional = (
-                    _extract_index_name_type_and_validators(col_type)
-                )
-                continue
-
-            base_type, _validators, is_optional, _is_not_required = _extract_type_and_validators(
-                col_type
-            )
-
-            # Handle Union types (represented as tuple) - use first type
-            if isinstance(base_type, tuple):
-                base_type = base_type[0]
-
-            if get_origin(base_type) is Literal:
-                literal_values = get_args(base_type)
-                if literal_values:
-                    first_value = literal_values[0]
-                    base_type = type(first_value)
-
-            dtype = _get_dtype_for_type(base_type)
-            columns[col_name] = pd.Series([], dtype=dtype)
+        column_dtypes, index_name, index_base_type = _empty_frame_plan(cls._schema)
+        columns = {
+            col_name: pd.Series([], dtype=dtype) for col_name, dtype in column_dtypes.items()
+        }
 
         # Create pandas DataFrame first, set index name, then convert to typed DataFrame
         raw_df = pd.DataFrame(columns)
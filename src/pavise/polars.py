@@ -1,6 +1,7 @@
 """Polars backend for type-parameterized DataFrame with Protocol-based schema validation."""
 
-from typing import Generic, Literal, TypeVar, get_args, get_origin, get_type_hints
+import weakref
+from typing import Generic, Literal, TypeVar, get_args, get_origin
 
 try:
     import polars as pl
@@ -8,12 +9,19 @@ except ImportError:
     raise ImportError("Polars is not installed. Install it with: pip install pavise[polars]")
 
 from pavise._polars.validation import validate_dataframe, validate_lazyframe_schema
+from pavise._schema_cache import schema_cache
 from pavise.types import NotRequiredColumn
 
 __all__ = ["DataFrame", "LazyFrame", "NotRequiredColumn"]
 
 SchemaT_co = TypeVar("SchemaT_co", covariant=True)
 
+# DataFrame[Schema] classes by schema, kept only while the class itself is referenced
+_typed_dataframes: weakref.WeakValueDictionary[type, type] = weakref.WeakValueDictionary()
+
+# LazyFrame[Schema] classes by schema, kept only while the class itself is referenced
+_typed_lazyframes: weakref.WeakValueDictionary[type, type] = weakref.WeakValueDictionary()
+
 
 def _build_empty_columns(schema: type) -> dict[str, pl.Series]:
     """
@@ -21,13 +29,26 @@ def _build_empty_columns(schema: type) -> dict[str, pl.Series]:
 
     Used by both DataFrame.make_empty() and LazyFrame.make_empty().
     """
-    from pavise._polars.validation import _extract_type_and_validators
+    return {
+        col_name: pl.Series([], dtype=dtype)
+        for col_name, dtype in _empty_column_dtypes(schema).items()
+    }
+
+
+@schema_cache
+def _empty_column_dtypes(schema: type) -> dict[str, pl.DataType]:
+    """
+    Resolve the dtype of each column of a Protocol schema.
+
+    The result is cached per schema, so make_empty only allocates the empty columns.
+    The returned dict is shared and must not be mutated.
+    """
+    from pavise._polars.validation import _compile_schema
 
-    type_hints = get_type_hints(schema, include_extras=True)
-    columns = {}
+    column_dtypes = {}
 
-    for col_name, col_type in type_hints.items():
-        base_type, _, _, _ = _extract_type_and_validators(col_type)
+    for spec in _compile_schema(schema).columns:
+        base_type = spec.base_type
 
         # Handle Union types (represented as tuple) - use first type
         if isinstance(base_type, tuple):
@@ -38,10 +59,9 @@ def _build_empty_columns(schema: type) -> dict[str, pl.Series]:
             if literal_values:
                 base_type = type(literal_values[0])
 
-        dtype = _get_dtype_for_type(base_type)
-        columns[col_name] = pl.Series([], dtype=dtype)
+        column_dtypes[spec.name] = _get_dtype_for_type(base_type)
 
-    return columns
+    return column_dtypes
 
 
 def _get_dtype_for_type(base_type: type) -> pl.DataType:
@@ -83,12 +103,20 @@ class DataFrame(pl.DataFrame, Generic[SchemaT_co]):
     _schema: type | None = None
 
     def __class_getitem__(cls, schema: type):
-        """Create a new DataFrame class with schema validation."""
+        """
+        Create a new DataFrame class with schema validation.
+
+        While a DataFrame[Schema] class is in use, subscribing again returns the same class.
+        The classes are held weakly, so they and their schemas can still be freed.
+        """
+        typed = _typed_dataframes.get(schema)
+        if typed is None:
 
-        class TypedDataFrame(DataFrame):
-            _schema = schema
+            class TypedDataFrame(DataFrame):
+                _schema = schema
 
-        return TypedDataFrame
+            typed = _typed_dataframes[schema] = TypedDataFrame
+        return typed
 
     def __init__(self, data, *args, strict=False, **kwargs):
         """
@@ -133,12 +161,20 @@ class LazyFrame(pl.LazyFrame, Generic[SchemaT_co]):
     _schema: type | None = None
 
     def __class_getitem__(cls, schema: type):
-        """Create a new LazyFrame class with schema validation."""
+        """
+        Create a new LazyFrame class with schema validation.
+
+        While a LazyFrame[Schema] class is in use, subscribing again returns the same class.
+        The classes are held weakly, so they and their schemas can still be freed.
+        """
+        typed = _typed_lazyframes.get(schema)
+        if typed is None:
 
-        class TypedLazyFrame(LazyFrame):
-            _schema = schema
+            class TypedLazyFrame(LazyFrame):
+                _schema = schema
 
-        return TypedLazyFrame
+            typed = _typed_lazyframes[schema] = TypedLazyFrame
+        return typed
 
     def __new__(cls, data: pl.LazyFrame, strict: bool = False):  # noqa: ARG003
         """Create LazyFrame instance by copying internal state from source."""
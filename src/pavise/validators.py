@@ -6,12 +6,16 @@ The actual validation logic is implemented in backend-specific modules:
 - _polars.validator_impl for polars
 """
 
-from collections.abc import Callable
-from dataclasses import dataclass
-from typing import Any
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, Literal
 
+# Unit in which MinLen/MaxLen measure string length
+LengthUnit = Literal["chars", "bytes"]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class Range:
     """Validate that numeric values are within a specified range.
 
@@ -23,7 +27,7 @@ class Range:
     max: float
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Unique:
     """Validate that column values are unique (no duplicates).
 
@@ -32,18 +36,24 @@ class Unique:
     """
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class In:
     """Validate that column values are within a set of allowed values.
 
+    The allowed values are stored as a tuple, so In is hashable like the other
+    validators and can appear in cached Annotated types.
+
     Example:
         status: Annotated[str, In(["pending", "approved", "rejected"])]
     """
 
-    allowed_values: list
+    allowed_values: Sequence[Any]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "allowed_values", tuple(self.allowed_values))
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Regex:
     r"""Validate that string values match a regular expression pattern.
 
@@ -52,31 +62,65 @@ class Regex:
     """
 
     pattern: str
+    _compiled: re.Pattern | None = field(init=False, repr=False, compare=False)
+    _anchored: str = field(init=False, repr=False, compare=False)
 
+    def __post_init__(self) -> None:
+        # Patterns only the polars regex engine understands are left uncompiled;
+        # the pandas backend then reports them at validation time.
+        try:
+            compiled = re.compile(self.pattern)
+        except re.error:
+            compiled = None
+        object.__setattr__(self, "_compiled", compiled)
+        object.__setattr__(self, "_anchored", f"^{self.pattern}$")
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MinLen:
     """Validate that string values have a minimum length.
 
+    Lengths are counted in characters by default. With unit="bytes" they are counted
+    in UTF-8 bytes, which backends read from string offsets without decoding; both
+    give the same result for ASCII data.
+
     Example:
         username: Annotated[str, MinLen(3)]
+        api_key: Annotated[str, MinLen(32, unit="bytes")]
     """
 
     min_length: int
+    unit: LengthUnit = "chars"
 
+    def __post_init__(self) -> None:
+        _check_length_unit(self.unit)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MaxLen:
     """Validate that string values have a maximum length.
 
+    Lengths are counted in characters by default, or in UTF-8 bytes with
+    unit="bytes" (see MinLen).
+
     Example:
         username: Annotated[str, MaxLen(20)]
+        api_key: Annotated[str, MaxLen(64, unit="bytes")]
     """
 
     max_length: int
+    unit: LengthUnit = "chars"
+
+    def __post_init__(self) -> None:
+        _check_length_unit(self.unit)
+
+
+def _check_length_unit(unit: str) -> None:
+    if unit not in ("chars", "bytes"):
+        raise ValueError(f"unit must be 'chars' or 'bytes', got {unit!r}")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Custom:
     """Validate using a custom validation function.
 
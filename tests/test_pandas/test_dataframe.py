@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import gc
+import weakref
 from datetime import date, datetime, timedelta
 from typing import Annotated, Any, Literal, Optional, Protocol, Union
 
@@ -66,6 +68,28 @@ def test_dataframe_class_getitem_returns_class():
     assert isinstance(type_of, type)
 
 
+def test_dataframe_class_getitem_reuses_class_per_schema():
+    """DataFrame[Schema] returns the same class for the same schema"""
+    assert DataFrame[SimpleSchema] is DataFrame[SimpleSchema]
+    assert DataFrame[SimpleSchema] is not DataFrame[MultiTypeSchema]
+
+
+def test_schema_is_released_after_use():
+    """Classes and caches built for a schema do not keep it alive once it is unused"""
+
+    class LocalSchema(Protocol):
+        a: Annotated[int, Range(0, 10)]
+
+    DataFrame[LocalSchema](pd.DataFrame({"a": [1, 2]}))
+    DataFrame[LocalSchema].make_empty()
+    schema_ref = weakref.ref(LocalSchema)
+    del LocalSchema
+    # The first collection frees the DataFrame[LocalSchema] class, the second the schema
+    gc.collect()
+    gc.collect()
+    assert schema_ref() is None
+
+
 def test_dataframe_with_schema_validates_correct_dataframe():
     """DataFrame[Schema](df) passes validation for correct DataFrame"""
     df = pd.DataFrame({"a": [1, 2, 3]})
@@ -53,6 +53,46 @@ def test_range_validator_rejects_values_above_maximum():
         DataFrame[AgeSchema](df)
 
 
+class PercentRange(Range):
+    pass
+
+
+class PercentSchema(Protocol):
+    score: Annotated[int, PercentRange(0, 100)]
+
+
+def test_validator_subclass_accepts_valid_values():
+    """A subclass of a validator is applied like the validator itself"""
+    df = pd.DataFrame({"score": [0, 50, 100]})
+    result = DataFrame[PercentSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_validator_subclass_rejects_invalid_values():
+    """A subclass of a validator rejects the values the validator rejects"""
+    df = pd.DataFrame({"score": [0, 150]})
+    with pytest.raises(ValidationError, match="score.*range"):
+        DataFrame[PercentSchema](df)
+
+
+class NullableAgeSchema(Protocol):
+    age: Annotated[int | None, Range(0, 150)]
+
+
+def test_range_validator_accepts_nullable_integer_values_within_range():
+    """Range validator accepts nullable integer columns with missing values"""
+    df = pd.DataFrame({"age": pd.array([25, None, 100], dtype="Int64")})
+    result = DataFrame[NullableAgeSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_range_validator_rejects_nullable_integer_values_out_of_range():
+    """Range validator rejects out-of-range values in nullable integer columns"""
+    df = pd.DataFrame({"age": pd.array([25, None, 200], dtype="Int64")})
+    with pytest.raises(ValidationError, match="age.*range"):
+        DataFrame[NullableAgeSchema](df)
+
+
 def test_unique_validator_accepts_unique_values():
     """Unique validator accepts columns with all unique values"""
     df = pd.DataFrame({"user_id": [1, 2, 3, 4]})
@@ -67,6 +107,22 @@ def test_unique_validator_rejects_duplicate_values():
         DataFrame[UserIdSchema](df)
 
 
+def test_unique_validator_rejects_duplicate_values_with_wide_span():
+    """Unique validator rejects duplicates among integers spread over a wide range"""
+    df = pd.DataFrame({"user_id": [-(2**62), 2**62, 7, 2**62]})
+    with pytest.raises(ValidationError, match="user_id.*duplicate") as exc_info:
+        DataFrame[UserIdSchema](df)
+    assert exc_info.value.invalid_samples == [(1, 2**62), (3, 2**62)]
+
+
+def test_unique_validator_rejects_duplicates_in_sorted_column():
+    """Unique validator rejects adjacent duplicates in a sorted column with a wide span"""
+    df = pd.DataFrame({"user_id": [-(2**62), 7, 2**40, 2**40, 2**62]})
+    with pytest.raises(ValidationError, match="user_id.*duplicate") as exc_info:
+        DataFrame[UserIdSchema](df)
+    assert exc_info.value.invalid_samples == [(2, 2**40), (3, 2**40)]
+
+
 def test_in_validator_accepts_allowed_values():
     """In validator accepts values within the allowed set"""
     df = pd.DataFrame({"status": ["pending", "approved", "rejected", "pending"]})
@@ -81,6 +137,35 @@ def test_in_validator_rejects_disallowed_values():
         DataFrame[StatusSchema](df)
 
 
+def test_in_validator_is_hashable():
+    """In stores its allowed values as a tuple, so it can be hashed"""
+    validator = In(["pending", "approved"])
+    assert validator.allowed_values == ("pending", "approved")
+    assert hash(validator) == hash(In(["pending", "approved"]))
+
+
+class CategoricalStatusSchema(Protocol):
+    status: Annotated[pd.CategoricalDtype, In(["pending", "approved"])]
+
+
+def test_in_validator_accepts_allowed_categorical_values():
+    """In validator accepts categorical values whose categories include disallowed ones"""
+    df = pd.DataFrame(
+        {"status": pd.Categorical(["pending", "approved"], categories=["pending", "approved", "x"])}
+    )
+    result = DataFrame[CategoricalStatusSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_in_validator_rejects_disallowed_categorical_values():
+    """In validator rejects categorical values and nulls outside the allowed set"""
+    df = pd.DataFrame({"status": pd.Categorical(["pending", "invalid", None, "approved"])})
+    with pytest.raises(ValidationError, match="status.*allowed values") as exc_info:
+        DataFrame[CategoricalStatusSchema](df)
+    assert exc_info.value.invalid_samples[0] == (1, "invalid")
+    assert len(exc_info.value.invalid_samples) == 2
+
+
 def test_regex_validator_accepts_matching_values():
     """Regex validator accepts values that match the pattern"""
     df = pd.DataFrame({"email": ["user@example.com", "test@test.org", "admin@company.co.jp"]})
@@ -95,6 +180,43 @@ def test_regex_validator_rejects_non_matching_values():
         DataFrame[EmailSchema](df)
 
 
+class OptionalCodeSchema(Protocol):
+    code: Annotated[str | None, Regex(r"[A-Z]{3}")]
+
+
+def test_regex_validator_ignores_missing_values():
+    """Regex validator skips missing values in optional string columns"""
+    df = pd.DataFrame({"code": ["ABC", None, "XYZ"]})
+    result = DataFrame[OptionalCodeSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+    df = pd.DataFrame({"code": ["ABC", None, "xyz"]})
+    with pytest.raises(ValidationError, match="code.*pattern") as exc_info:
+        DataFrame[OptionalCodeSchema](df)
+    assert exc_info.value.invalid_samples == [(2, "xyz")]
+
+
+def test_regex_validator_ignores_missing_values_in_str_dtype():
+    """Regex validator skips missing values in columns of the pandas str dtype"""
+    with pd.option_context("future.infer_string", True):
+        df = pd.DataFrame({"code": ["ABC", None, "xyz"]})
+        with pytest.raises(ValidationError, match="code.*pattern") as exc_info:
+            DataFrame[OptionalCodeSchema](df)
+    assert exc_info.value.invalid_samples == [(2, "xyz")]
+
+
+class CategoricalCodeSchema(Protocol):
+    code: Annotated[pd.CategoricalDtype, Regex(r"[A-Z]{2}$")]
+
+
+def test_regex_validator_rejects_non_matching_categorical_values():
+    """Regex validator checks Categorical columns through their categories"""
+    df = pd.DataFrame({"code": pd.Categorical(["JP", "usa", None, "usa"])})
+    with pytest.raises(ValidationError, match="code.*pattern") as exc_info:
+        DataFrame[CategoricalCodeSchema](df)
+    assert exc_info.value.invalid_samples == [(1, "usa"), (3, "usa")]
+
+
 def test_minlen_validator_accepts_valid_length():
     """MinLen validator accepts strings with sufficient length"""
     df = pd.DataFrame({"username": ["alice", "bob123", "charlie"]})
@@ -123,6 +245,37 @@ def test_maxlen_validator_rejects_long_strings():
         DataFrame[UsernameMaxLenSchema](df)
 
 
+def test_length_validators_count_characters_of_arrow_strings():
+    """MinLen/MaxLen count characters, not bytes, in Arrow-backed string columns"""
+    pytest.importorskip("pyarrow")
+    df = pd.DataFrame({"username": pd.array(["héllo", "bob"], dtype="string[pyarrow]")})
+    assert isinstance(DataFrame[UsernameMinLenSchema](df), pd.DataFrame)
+
+    df = pd.DataFrame({"username": pd.array(["héllo", "ab"], dtype="string[pyarrow]")})
+    with pytest.raises(ValidationError, match="username.*length") as exc_info:
+        DataFrame[UsernameMinLenSchema](df)
+    assert exc_info.value.invalid_samples == [(1, "ab")]
+
+
+class ByteLengthSchema(Protocol):
+    name: Annotated[str, MaxLen(4, unit="bytes")]
+
+
+def test_maxlen_validator_with_bytes_unit_counts_utf8_bytes():
+    """MaxLen with unit="bytes" rejects strings whose UTF-8 encoding is too long"""
+    df = pd.DataFrame({"name": ["abcd", "caf\u00e9", "ab"]})
+    with pytest.raises(ValidationError, match="name.*length") as exc_info:
+        DataFrame[ByteLengthSchema](df)
+    assert exc_info.value.invalid_samples == [(1, "caf\u00e9")]
+    assert "(length: 5 bytes)" in str(exc_info.value)
+
+
+def test_length_validators_reject_unknown_unit():
+    """MinLen/MaxLen only accept "chars" or "bytes" as unit"""
+    with pytest.raises(ValueError, match="unit"):
+        MinLen(1, unit="words")
+
+
 def is_positive(value) -> bool:
     """Custom validator function for testing."""
     return value > 0
@@ -144,3 +297,50 @@ def test_custom_validator_rejects_invalid_values():
     df = pd.DataFrame({"value": [1, -5, 3]})
     with pytest.raises(ValidationError, match="value.*must be positive"):
         DataFrame[CustomValidatorSchema](df)
+
+
+class MeasurementSchema(Protocol):
+    age: Annotated[int, Range(0, 150)]
+    height: Annotated[float, Range(0.0, 300.0)]
+    weight: Annotated[float, Range(0.0, 500.0)]
+
+
+def test_multiple_range_validators_accept_valid_dataframe():
+    """Range validators across several columns accept a valid DataFrame"""
+    df = pd.DataFrame({"age": [25, 30], "height": [170.5, 180.0], "weight": [60.0, 75.5]})
+    result = DataFrame[MeasurementSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_multiple_range_validators_report_failing_column():
+    """Range validators across several columns report the column that failed"""
+    df = pd.DataFrame({"age": [25, 30], "height": [170.5, 180.0], "weight": [60.0, 750.0]})
+    with pytest.raises(ValidationError, match="weight.*range") as exc_info:
+        DataFrame[MeasurementSchema](df)
+    assert exc_info.value.invalid_samples == [(1, 750.0)]
+
+
+def test_validators_accept_empty_dataframe():
+    """Validators hold on an empty DataFrame of the right types"""
+    df = pd.DataFrame({"age": pd.Series([], dtype="int64"), "height": [], "weight": []})
+    result = DataFrame[MeasurementSchema](df)
+    assert isinstance(result, pd.DataFrame)
+
+
+def test_empty_dataframe_is_still_type_checked():
+    """An empty DataFrame with a wrong column type is rejected"""
+    df = pd.DataFrame({"age": pd.Series([], dtype="object"), "height": [], "weight": []})
+    with pytest.raises(ValidationError, match="age.*expected int"):
+        DataFrame[MeasurementSchema](df)
+
+
+class RangeThenIntSchema(Protocol):
+    a: Annotated[int, Range(0, 10)]
+    b: int
+
+
+def test_validator_error_of_earlier_column_precedes_later_type_error():
+    """Columns are type-checked and validated in schema order, one column at a time"""
+    df = pd.DataFrame({"a": [1, 20], "b": ["x", "y"]})
+    with pytest.raises(ValidationError, match="Column 'a'.*range"):
+        DataFrame[RangeThenIntSchema](df)
@@ -1,6 +1,6 @@
 """Tests for LazyFrame[Schema] support."""
 
-from typing import Literal, Protocol
+from typing import Annotated, Literal, Protocol
 
 import pytest
 
@@ -33,6 +33,10 @@ class LiteralSchema(Protocol):
     priority: Literal[1, 2, 3]
 
 
+class DescribedSchema(Protocol):
+    user_id: Annotated[int, "user id"]
+
+
 class TestLazyFrameBasic:
     """Basic tests for LazyFrame[Schema]"""
 
@@ -59,6 +63,12 @@ class TestLazyFrameBasic:
         with pytest.raises(ValidationError, match="Column 'a': expected int"):
             LazyFrame[SimpleSchema](lf)
 
+    def test_lazyframe_with_schema_ignores_annotated_metadata(self):
+        """LazyFrame[Schema](lf) checks only the schema, not Annotated metadata"""
+        lf = pl.LazyFrame({"user_id": [1, 2, 3]})
+        result = LazyFrame[DescribedSchema](lf)
+        assert isinstance(result, pl.LazyFrame)
+
 
 class TestLazyFrameCollect:
     """Tests for LazyFrame.collect()"""
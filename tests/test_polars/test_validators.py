@@ -53,6 +53,40 @@ def test_range_validator_rejects_values_above_maximum():
         DataFrame[AgeSchema](df)
 
 
+class GradeSchema(Protocol):
+    grade: Annotated[str, Range("b", "d")]
+
+
+def test_range_validator_rejects_strings_out_of_range():
+    """Range validator compares string bounds as values, not column names"""
+    df = pl.DataFrame({"grade": ["b", "c", "e"]})
+    with pytest.raises(ValidationError, match="grade.*range") as exc_info:
+        DataFrame[GradeSchema](df)
+    assert exc_info.value.invalid_samples == [(2, "e")]
+
+
+class PercentRange(Range):
+    pass
+
+
+class PercentSchema(Protocol):
+    score: Annotated[int, PercentRange(0, 100)]
+
+
+def test_validator_subclass_accepts_valid_values():
+    """A subclass of a validator is applied like the validator itself"""
+    df = pl.DataFrame({"score": [0, 50, 100]})
+    result = DataFrame[PercentSchema](df)
+    assert isinstance(result, pl.DataFrame)
+
+
+def test_validator_subclass_rejects_invalid_values():
+    """A subclass of a validator rejects the values the validator rejects"""
+    df = pl.DataFrame({"score": [0, 150]})
+    with pytest.raises(ValidationError, match="score.*range"):
+        DataFrame[PercentSchema](df)
+
+
 def test_unique_validator_accepts_unique_values():
     """Unique validator accepts columns with all unique values"""
     df = pl.DataFrame({"user_id": [1, 2, 3, 4]})
@@ -95,6 +129,25 @@ def test_regex_validator_rejects_non_matching_values():
         DataFrame[EmailSchema](df)
 
 
+class CategoricalCodeSchema(Protocol):
+    code: Annotated[pl.Categorical, Regex(r"[A-Z]{2}")]
+
+
+def test_regex_validator_accepts_matching_categorical_values():
+    """Regex validator accepts Categorical columns whose values match the pattern"""
+    df = pl.DataFrame({"code": pl.Series(["JP", "US", None, "JP"], dtype=pl.Categorical)})
+    result = DataFrame[CategoricalCodeSchema](df)
+    assert isinstance(result, pl.DataFrame)
+
+
+def test_regex_validator_rejects_non_matching_categorical_values():
+    """Regex validator rejects Categorical values that don't match the pattern"""
+    df = pl.DataFrame({"code": pl.Series(["JP", "usa", "JP", "usa"], dtype=pl.Categorical)})
+    with pytest.raises(ValidationError, match="code.*pattern") as exc_info:
+        DataFrame[CategoricalCodeSchema](df)
+    assert exc_info.value.invalid_samples == [(1, "usa"), (3, "usa")]
+
+
 def test_minlen_validator_accepts_valid_length():
     """MinLen validator accepts strings with sufficient length"""
     df = pl.DataFrame({"username": ["alice", "bob123", "charlie"]})
@@ -123,6 +176,25 @@ def test_maxlen_validator_rejects_long_strings():
         DataFrame[UsernameMaxLenSchema](df)
 
 
+class ByteLengthSchema(Protocol):
+    name: Annotated[str, MaxLen(4, unit="bytes")]
+
+
+def test_maxlen_validator_with_bytes_unit_counts_utf8_bytes():
+    """MaxLen with unit="bytes" rejects strings whose UTF-8 encoding is too long"""
+    df = pl.DataFrame({"name": ["abcd", "caf\u00e9", "ab"]})
+    with pytest.raises(ValidationError, match="name.*length") as exc_info:
+        DataFrame[ByteLengthSchema](df)
+    assert exc_info.value.invalid_samples == [(1, "caf\u00e9")]
+    assert "(length: 5 bytes)" in str(exc_info.value)
+
+
+def test_length_validators_reject_unknown_unit():
+    """MinLen/MaxLen only accept "chars" or "bytes" as unit"""
+    with pytest.raises(ValueError, match="unit"):
+        MinLen(1, unit="words")
+
+
 def is_positive(value) -> bool:
     """Custom validator function for testing."""
     return value > 0
@@ -144,3 +216,73 @@ def test_custom_validator_rejects_invalid_values():
     df = pl.DataFrame({"value": [1, -5, 3]})
     with pytest.raises(ValidationError, match="value.*must be positive"):
         DataFrame[CustomValidatorSchema](df)
+
+
+class MultiValidatorSchema(Protocol):
+    user_id: Annotated[int, Unique(), Range(1, 1000)]
+    username: Annotated[str, MinLen(3), MaxLen(20)]
+    status: Annotated[str, In(["pending", "approved", "rejected"])]
+
+
+def test_multiple_validators_accept_valid_dataframe():
+    """Validators across several columns accept a valid DataFrame"""
+    df = pl.DataFrame(
+        {
+            "user_id": [1, 2, 3],
+            "username": ["alice", "bob", "charlie"],
+            "status": ["pending", "approved", "rejected"],
+        }
+    )
+    result = DataFrame[MultiValidatorSchema](df)
+    assert isinstance(result, pl.DataFrame)
+
+
+def test_multiple_validators_report_failing_column():
+    """Validators across several columns report the column that failed"""
+    df = pl.DataFrame(
+        {
+            "user_id": [1, 2, 3],
+            "username": ["alice", "bob", "charlie"],
+            "status": ["pending", "unknown", "rejected"],
+        }
+    )
+    with pytest.raises(ValidationError, match="status.*allowed values"):
+        DataFrame[MultiValidatorSchema](df)
+
+
+def test_multiple_validators_accept_empty_dataframe():
+    """Validators hold on an empty DataFrame of the right types"""
+    df = pl.DataFrame(schema={"user_id": pl.Int64, "username": pl.String, "status": pl.String})
+    result = DataFrame[MultiValidatorSchema](df)
+    assert isinstance(result, pl.DataFrame)
+
+
+def test_empty_dataframe_is_still_type_checked():
+    """An empty DataFrame with a wrong column type is rejected"""
+    df = pl.DataFrame(schema={"user_id": pl.String, "username": pl.String, "status": pl.String})
+    with pytest.raises(ValidationError, match="user_id"):
+        DataFrame[MultiValidatorSchema](df)
+
+
+class RangeThenIntSchema(Protocol):
+    a: Annotated[int, Range(0, 10)]
+    b: int
+
+
+def test_validator_error_of_earlier_column_precedes_later_type_error():
+    """Columns are reported in schema order, validator failures before later type errors"""
+    df = pl.DataFrame({"a": [1, 20], "b": ["x", "y"]})
+    with pytest.raises(ValidationError, match="Column 'a'.*range"):
+        DataFrame[RangeThenIntSchema](df)
+
+
+class IntThenRangeSchema(Protocol):
+    b: int
+    a: Annotated[int, Range(0, 10)]
+
+
+def test_type_error_of_earlier_column_precedes_later_validator_error():
+    """A type error is reported before validator failures of later columns"""
+    df = pl.DataFrame({"b": ["x", "y"], "a": [1, 20]})
+    with pytest.raises(ValidationError, match="Column 'b'"):
+        DataFrame[IntThenRangeSchema](df)